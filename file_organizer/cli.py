@@ -6,6 +6,7 @@ Handles argument parsing and orchestrates operations.
 
 import argparse
 import sys
+from dataclasses import replace
 from pathlib import Path
 from typing import List, Optional
 
@@ -18,10 +19,36 @@ from .operations import (
 )
 
 
-def _print_section(title: str) -> None:
-    print("\n" + "=" * 60)
-    print(title)
-    print("=" * 60)
+class _BufferedOutput:
+    """
+    Output callback that batches lines before writing to stdout.
+
+    print() pays a formatted write (and, on a TTY, a flush) per line;
+    for runs that touch thousands of files that is one syscall per
+    file. Batching joins lines and writes them in blocks, with an
+    explicit flush at the end of the run.
+    """
+
+    def __init__(self, batch_size: int = 64):
+        self._lines: List[str] = []
+        self._batch_size = batch_size
+
+    def __call__(self, message: str) -> None:
+        self._lines.append(message)
+        if len(self._lines) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+        sys.stdout.flush()
+
+
+def _print_section(title: str, output) -> None:
+    output("\n" + "=" * 60)
+    output(title)
+    output("=" * 60)
 
 
 def create_parser(config: Config = DEFAULT_CONFIG) -> argparse.ArgumentParser:
@@ -92,6 +119,14 @@ Safety:
         help=f"Find duplicate files and move extras to {config.duplicates_folder}/"
     )
     
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Worker threads for hashing and moving files (default: pick automatically)"
+    )
+
     parser.add_argument(
         "--recents", "-r",
         action="store_true",
@@ -116,42 +151,49 @@ def run(
         Exit code (0 for success, 1 for error)
     """
     directory = Path(args.directory).expanduser().resolve()
-    
+
     if not directory.is_dir():
         print(f"Error: '{directory}' is not a valid directory", file=sys.stderr)
         return 1
-    
+
+    if getattr(args, "jobs", 0) > 0:
+        config = replace(config, parallelism=args.jobs)
+
+    out = _BufferedOutput()
     try:
         # Run operations in logical order:
         # 1. Cleanup temp files first (so they don't get organized)
         # 2. Find and handle duplicates (before organizing moves files around)
         # 3. Organize remaining files into categories
         # 4. Archive old files last
-        
+
         if args.cleanup:
-            _print_section("CLEANING UP TEMPORARY FILES")
-            cleanup_temp_files(directory, dry_run=args.dry_run, config=config)
+            _print_section("CLEANING UP TEMPORARY FILES", out)
+            cleanup_temp_files(directory, dry_run=args.dry_run, config=config, output=out)
 
         if args.duplicates:
-            _print_section("FINDING DUPLICATE FILES")
-            handle_duplicates(directory, dry_run=args.dry_run, config=config)
+            _print_section("FINDING DUPLICATE FILES", out)
+            handle_duplicates(directory, dry_run=args.dry_run, config=config, output=out)
 
         organize_files(
             directory,
             dry_run=args.dry_run,
             use_recents=args.recents,
-            config=config
+            config=config,
+            output=out,
         )
 
         if args.archive:
-            _print_section("ARCHIVING OLD FILES")
-            archive_old_files(directory, dry_run=args.dry_run, config=config)
-        
+            _print_section("ARCHIVING OLD FILES", out)
+            archive_old_files(directory, dry_run=args.dry_run, config=config, output=out)
+
         return 0
-        
+
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
+    finally:
+        out.flush()
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -6,7 +6,8 @@ Default values match the original script behavior.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Set
+from pathlib import Path
+from typing import AbstractSet, Dict, Optional, Set, Tuple
 
 
 @dataclass
@@ -43,18 +44,28 @@ class Config:
     
     # Duplicate detection settings
     duplicates_folder: str = "_Duplicates"
-    hash_buffer_size: int = 8192
+    hash_buffer_size: int = 1024 * 1024  # 1 MiB
+
+    # Worker threads for hashing candidate files (0 = pick automatically)
+    parallelism: int = 0
+
+    # Persistent hash cache database (None = no caching across runs).
+    # See file_organizer.hash_cache.default_cache_path() for the
+    # conventional location.
+    hash_cache_path: Optional[Path] = None
     
-    # File extension to category mapping
-    categories: Dict[str, Set[str]] = field(default_factory=lambda: {
-        "Images": {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".webp", ".ico", ".tiff", ".heic"},
-        "Documents": {".pdf", ".doc", ".docx", ".txt", ".rtf", ".odt", ".xls", ".xlsx", ".ppt", ".pptx", ".csv"},
-        "Audio": {".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a"},
-        "Video": {".mp4", ".avi", ".mkv", ".mov", ".wmv", ".flv", ".webm", ".m4v"},
-        "Archives": {".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz"},
-        "Code": {".py", ".js", ".ts", ".html", ".css", ".json", ".xml", ".yml", ".yaml", ".md", ".sh", ".c", ".cpp", ".h", ".java", ".go", ".rs"},
-        "Executables": {".exe", ".msi", ".dmg", ".app", ".deb", ".rpm"},
-        "Fonts": {".ttf", ".otf", ".woff", ".woff2"},
+    # File extension to category mapping. The defaults are frozensets:
+    # they are shared between Config instances and signal that lookups
+    # go through the inverted index, not mutation of these sets.
+    categories: Dict[str, AbstractSet[str]] = field(default_factory=lambda: {
+        "Images": frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".webp", ".ico", ".tiff", ".heic"}),
+        "Documents": frozenset({".pdf", ".doc", ".docx", ".txt", ".rtf", ".odt", ".xls", ".xlsx", ".ppt", ".pptx", ".csv"}),
+        "Audio": frozenset({".mp3", ".wav", ".flac", ".aac", ".ogg", ".wma", ".m4a"}),
+        "Video": frozenset({".mp4", ".avi", ".mkv", ".mov", ".wmv", ".flv", ".webm", ".m4v"}),
+        "Archives": frozenset({".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz"}),
+        "Code": frozenset({".py", ".js", ".ts", ".html", ".css", ".json", ".xml", ".yml", ".yaml", ".md", ".sh", ".c", ".cpp", ".h", ".java", ".go", ".rs"}),
+        "Executables": frozenset({".exe", ".msi", ".dmg", ".app", ".deb", ".rpm"}),
+        "Fonts": frozenset({".ttf", ".otf", ".woff", ".woff2"}),
     })
     
     # Default category for unrecognized extensions
@@ -63,21 +74,42 @@ class Config:
     # Special folder prefix (folders starting with this are skipped in scans)
     special_folder_prefix: str = "_"
     
+    def __post_init__(self) -> None:
+        # Invert the category mapping once so lookups are a single dict
+        # probe instead of scanning every category's extension set.
+        self._ext_index: Dict[str, str] = {
+            ext.lower(): category
+            for category, extensions in self.categories.items()
+            for ext in extensions
+        }
+        # str.endswith takes a tuple and checks all suffixes in one
+        # C-level call; scan loops use this instead of splitting the
+        # extension off every name.
+        self._auto_delete_suffixes: Tuple[str, ...] = tuple(
+            ext.lower() for ext in self.auto_delete_extensions
+        )
+
+    @property
+    def auto_delete_suffixes(self) -> Tuple[str, ...]:
+        """Lowercased auto-delete extensions, as a tuple for str.endswith."""
+        return self._auto_delete_suffixes
+
     def get_category(self, extension: str) -> str:
         """
         Get the category for a file extension.
-        
+
         Args:
             extension: File extension including dot (e.g., ".jpg")
-            
+
         Returns:
             Category name or default_category if not found
         """
-        ext_lower = extension.lower()
-        for category, extensions in self.categories.items():
-            if ext_lower in extensions:
-                return category
-        return self.default_category
+        # Extensions are overwhelmingly lowercase already; probe the
+        # index directly before paying for str.lower.
+        category = self._ext_index.get(extension)
+        if category is not None:
+            return category
+        return self._ext_index.get(extension.lower(), self.default_category)
     
     def is_special_folder(self, name: str) -> bool:
         """Check if a folder name is a special folder (starts with prefix)."""
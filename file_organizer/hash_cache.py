@@ -0,0 +1,148 @@
+"""
+Persistent hash cache for duplicate detection.
+
+Stores (path, size, mtime_ns) -> hash in a small sqlite database so that
+re-running duplicate detection over an unchanged tree never re-reads file
+contents. Entries are validated against size and mtime, so modified files
+are transparently re-hashed.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL
+)
+"""
+
+
+def default_cache_path() -> Path:
+    """
+    Return the default location for the hash cache database.
+
+    Follows XDG conventions: $XDG_CACHE_HOME/file-organizer/hashes.db,
+    falling back to ~/.cache.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base) / "file-organizer" / "hashes.db"
+
+
+class HashCache:
+    """
+    sqlite-backed cache of file hashes keyed by absolute path.
+
+    Lookups compare the stored size and mtime_ns against the file's
+    current stat, so stale entries are never returned. Writes are
+    buffered in a single transaction and flushed on close.
+
+    The cache is disposable and must never take its caller down: a
+    corrupt or foreign file at db_path is deleted and recreated, and
+    any database error afterwards silently disables the cache for the
+    rest of the run (get returns None, put is a no-op).
+
+    Example:
+        with HashCache(path) as cache:
+            cached = cache.get(file_path, stat)
+            if cached is None:
+                cache.put(file_path, stat, compute_file_hash(file_path))
+    """
+
+    def __init__(self, db_path: Path):
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self._conn = self._open(db_path)
+        except sqlite3.Error:
+            # Corrupt or not a database: throw the file away and start
+            # over; if even that fails, run uncached.
+            try:
+                db_path.unlink()
+                self._conn = self._open(db_path)
+            except (OSError, sqlite3.Error):
+                pass
+
+    @staticmethod
+    def _open(db_path: Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def _disable(self) -> None:
+        """Drop the connection after an error; the run continues uncached."""
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+        self._conn = None
+
+    def get(self, file_path: Path, st: os.stat_result) -> Optional[str]:
+        """
+        Look up the cached hash for a file.
+
+        Args:
+            file_path: Path to the file
+            st: The file's current stat result
+
+        Returns:
+            The cached hash, or None if absent, stale, or disabled
+        """
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, hash FROM hashes WHERE path = ?",
+                (str(file_path),),
+            ).fetchone()
+        except sqlite3.Error:
+            self._disable()
+            return None
+        if row is None:
+            return None
+        size, mtime_ns, file_hash = row
+        if size != st.st_size or mtime_ns != st.st_mtime_ns:
+            return None
+        return file_hash
+
+    def put(self, file_path: Path, st: os.stat_result, file_hash: str) -> None:
+        """Store (or replace) the hash for a file."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hashes (path, size, mtime_ns, hash) "
+                "VALUES (?, ?, ?, ?)",
+                (str(file_path), st.st_size, st.st_mtime_ns, file_hash),
+            )
+        except sqlite3.Error:
+            self._disable()
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.commit()
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+        self._conn = None
+
+    def __enter__(self) -> "HashCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
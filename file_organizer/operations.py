@@ -5,33 +5,45 @@ These functions perform the actual file system operations (move, delete).
 They use a callback pattern for output to separate concerns from the CLI.
 """
 
+import errno
+import filecmp
+import os
+import queue
 import shutil
+import threading
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .config import Config, DEFAULT_CONFIG
+from .hash_cache import HashCache
 from .utils import (
+    FileInfo,
+    claim_unique_filename,
     compute_file_hash,
+    compute_file_sketch,
     format_file_size,
-    generate_unique_filename,
-    get_category,
-    get_file_age_days,
-    should_skip_for_duplicates,
 )
 
 
 @dataclass
 class OperationResult:
-    """Result of a file operation with statistics."""
+    """
+    Result of a file operation with statistics.
+
+    actions holds compact tuples (kind, name, ...raw values) rather than
+    pre-rendered strings; use format_action to render one for display.
+    """
     success_count: int = 0
     skip_count: int = 0
     error_count: int = 0
-    actions: List[str] = field(default_factory=list)
+    actions: List[Tuple] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
-    
+
     # For duplicate detection
     space_recoverable: int = 0
 
@@ -40,6 +52,241 @@ class OperationResult:
 OutputCallback = Callable[[str], None]
 
 
+def format_action(action: Tuple) -> str:
+    """
+    Render a recorded action tuple as a human-readable line.
+
+    Actions are stored as raw tuples so large runs don't retain one
+    formatted string per file; formatting happens only at print time or
+    when a caller iterates the result.
+    """
+    kind = action[0]
+    if kind == "recents":
+        _, name, age_hours, folder = action
+        return f"{name} ({age_hours:.1f}h old) -> {folder}/"
+    if kind == "large":
+        _, name, size, folder = action
+        return f"{name} ({format_file_size(size)}) -> {folder}/"
+    if kind == "category":
+        _, name, category = action
+        return f"{name} -> {category}/"
+    if kind == "archive":
+        _, name, age_days, folder, category = action
+        return f"{name} ({age_days} days old) -> {folder}/{category}/"
+    if kind == "delete":
+        _, name, age_days = action
+        return f"{name} ({age_days} days old)"
+    if kind == "duplicate":
+        _, rel_path, size = action
+        return f"{rel_path} ({format_file_size(size)})"
+    return " ".join(str(part) for part in action)
+
+
+def _cross_device_move(src: str, dst: str) -> None:
+    """
+    Move a file across filesystems with os.copy_file_range.
+
+    The kernel copies directly between the two file descriptors, so the
+    bytes never pass through userspace — typically several times faster
+    than shutil.move's Python read/write loop. Raises AttributeError or
+    OSError where the syscall is missing or the filesystems refuse it;
+    callers fall back to shutil.move.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    shutil.copystat(src, dst)
+    os.unlink(src)
+
+
+def _move_into(src, destination: Path) -> Path:
+    """
+    Move src to destination, claiming a unique name atomically.
+
+    The name is reserved with O_CREAT|O_EXCL and then replaced by the
+    rename itself, so there is no stat-then-move window in which another
+    process can take it. On failure the placeholder is removed.
+    """
+    claimed = claim_unique_filename(destination)
+    try:
+        _fast_move(src, claimed)
+    except Exception:
+        try:
+            os.unlink(claimed)
+        except OSError:
+            pass
+        raise
+    return claimed
+
+
+def _fast_move(src, dst) -> None:
+    """
+    Move a file, preferring a single rename syscall.
+
+    Destinations here are always inside the scanned directory, so source
+    and destination are nearly always on the same filesystem and
+    os.replace succeeds in one syscall. Cross-device moves try a
+    kernel-side copy_file_range first and fall back to shutil.move's
+    copy + unlink where that is unavailable.
+    """
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    src, dst = str(src), str(dst)
+    try:
+        _cross_device_move(src, dst)
+    except (AttributeError, OSError):
+        # Drop any partial copy before handing over to shutil.move
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        shutil.move(src, dst)
+
+
+def _visible_files(
+    directory: Path,
+    config: Config,
+    skip_prefixes: Tuple[str, ...] = ('.',),
+):
+    """
+    Yield scandir entries for regular files in a directory.
+
+    Names starting with any of skip_prefixes are rejected with a single
+    C-level startswith before any type check, keeping the hot loops free
+    of per-file Python method dispatch. The default skips hidden names
+    only; each operation passes the prefixes matching its own semantics
+    (duplicate scanning also skips special folders' prefix, cleanup
+    skips nothing).
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            # is_file() follows symlinks, like the Path.is_file() scans
+            # it replaced; the cached d_type still answers without a
+            # syscall for regular files.
+            if not entry.name.startswith(skip_prefixes) and entry.is_file():
+                yield entry
+
+
+def _prefetch(file_path: Path) -> None:
+    """
+    Ask the kernel to start reading a file before its hash job runs.
+
+    Candidates wait in the pool queue after being submitted; a WILLNEED
+    hint issued at submit time lets readahead overlap that wait, so the
+    hash thread often finds the data already in the page cache. Purely
+    best-effort and a no-op where posix_fadvise is unavailable.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _hash_workers(config: Config) -> int:
+    """Resolve the hashing thread count from config (0 = auto)."""
+    if config.parallelism > 0:
+        return config.parallelism
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+def _move_workers(config: Config) -> int:
+    """
+    Resolve the move thread count from config (0 = auto).
+
+    Moves are metadata ops, not bulk reads, so the auto default is a
+    small fixed pool rather than the hashing pool's CPU multiple.
+    """
+    if config.parallelism > 0:
+        return config.parallelism
+    return 8
+
+
+def _parallel_walk(
+    root: Path,
+    config: Config,
+    sink: Callable[[FileInfo], None],
+    workers: int = 8,
+    on_error: Optional[Callable[[str], None]] = None,
+) -> None:
+    """
+    Recursively scan files under root using a pool of scandir workers.
+
+    Each worker pops a directory off a shared queue, scans it, and pushes
+    subdirectories back on the queue, so traversal of sibling directories
+    overlaps — a big win on high-latency filesystems (NFS, SMB). Hidden
+    and special folders are pruned without descending into them, and
+    hidden or empty files are skipped (matching the non-recursive
+    duplicate scan's semantics).
+
+    Files are streamed to sink (called holding a lock, so it need not be
+    thread-safe itself) as they are found, rather than materialized into
+    one big list — consumers that bucket or count keep memory flat no
+    matter how large the tree is. Entries and directories that cannot be
+    inspected are reported through on_error (called under the same lock)
+    so unreadable files are not silently dropped from the scan.
+    """
+    sink_lock = threading.Lock()
+    dir_queue: queue.Queue = queue.Queue()
+    dir_queue.put(str(root))
+    skip_prefixes = ('.', config.special_folder_prefix)
+
+    def _worker() -> None:
+        while True:
+            directory = dir_queue.get()
+            if directory is None:
+                dir_queue.task_done()
+                return
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.name.startswith(skip_prefixes):
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                dir_queue.put(entry.path)
+                            elif entry.is_file():
+                                info = FileInfo(Path(entry.path), entry.stat())
+                                if info.st_size > 0:
+                                    with sink_lock:
+                                        sink(info)
+                        except OSError as e:
+                            if on_error is not None:
+                                with sink_lock:
+                                    on_error(f"Could not inspect {entry.name}: {e}")
+                            continue
+            except OSError as e:
+                if on_error is not None:
+                    with sink_lock:
+                        on_error(f"Could not scan {os.path.basename(directory)}: {e}")
+            finally:
+                dir_queue.task_done()
+
+    threads = [threading.Thread(target=_worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    dir_queue.join()
+    for _ in threads:
+        dir_queue.put(None)
+    for thread in threads:
+        thread.join()
+
+
 def cleanup_empty_folders(
     directory: Path,
     dry_run: bool = False,
@@ -114,65 +361,128 @@ def organize_files(
     if not directory.is_dir():
         raise ValueError(f"'{directory}' is not a valid directory")
     
-    # Get all files in the directory (top level only)
-    files = [f for f in directory.iterdir() if f.is_file()]
-    
-    if not files:
+    # Count files up front (name/type only, no stats) so the header can
+    # report a total without materializing the whole listing; processing
+    # below streams entries one at a time to keep memory flat on huge
+    # directories. While counting, track distinct extensions (capped at
+    # two — we only care whether there is exactly one): dump directories
+    # full of a single type are common, and a uniform extension lets the
+    # category lookup be hoisted out of the per-file loop entirely.
+    total_files = 0
+    exts_seen: set = set()
+    with os.scandir(directory) as it:
+        for e in it:
+            if e.is_file():
+                total_files += 1
+                if len(exts_seen) < 2:
+                    exts_seen.add(os.path.splitext(e.name)[1])
+
+    if not total_files:
         output("No files found to organize.")
         return result
-    
+
     prefix = "[DRY RUN] " if dry_run else ""
-    output(f"\n{prefix}Organizing {len(files)} files in: {directory}\n")
+    output(f"\n{prefix}Organizing {total_files} files in: {directory}\n")
     output("-" * 60)
     now_ts = datetime.now().timestamp()
-    
-    for file_path in files:
-        # Skip hidden files
-        if config.is_hidden(file_path.name):
-            result.skip_count += 1
-            continue
+    created_dirs: set = set()
+    # Build destinations with plain string joins; Path objects are only
+    # constructed for files that are actually moved.
+    dir_str = str(directory)
+    # Bind loop invariants to locals once; local-name lookups are cheaper
+    # than repeated attribute and method resolution in the per-file loop.
+    recents_thresh = config.recents_age_hours
+    recents_folder = config.recents_folder
+    large_thresh = config.large_file_threshold_bytes
+    large_folder = config.large_files_folder
+    get_cat = config.get_category
+    splitext = os.path.splitext
+    # Every file shares one extension: resolve the category once and
+    # skip the splitext + dict lookup below. Files can arrive between
+    # the counting and processing passes, so the fast path only applies
+    # to names that actually carry the uniform extension (one C-level
+    # endswith per file); anything else falls back to the full lookup.
+    uniform_ext = next(iter(exts_seen)) if len(exts_seen) == 1 else None
+    uniform_category = get_cat(uniform_ext) if uniform_ext else None
+
+    processed = 0
+    # (action, name, src, category) per file to move; empty on dry runs.
+    moves: List[Tuple[Tuple, str, str, str]] = []
+    for entry in _visible_files(directory, config):
+        processed += 1
         try:
-            stat = file_path.stat()
+            stat = entry.stat()
         except (PermissionError, OSError) as e:
-            error_msg = f"{file_path.name}: {e}"
+            error_msg = f"{entry.name}: {e}"
             output(f"  [ERROR] {error_msg}")
             result.errors.append(error_msg)
             result.error_count += 1
             continue
-        
+
         # Determine target category
         age_hours = (now_ts - stat.st_mtime) / 3600
-        if use_recents and age_hours < config.recents_age_hours:
-            category = config.recents_folder
-            action = f"{file_path.name} ({age_hours:.1f}h old) -> {config.recents_folder}/"
-        elif stat.st_size > config.large_file_threshold_bytes:
-            size_str = format_file_size(stat.st_size)
-            category = config.large_files_folder
-            action = f"{file_path.name} ({size_str}) -> {config.large_files_folder}/"
+        if use_recents and age_hours < recents_thresh:
+            category = recents_folder
+            action = ("recents", entry.name, age_hours, recents_folder)
+        elif stat.st_size > large_thresh:
+            category = large_folder
+            action = ("large", entry.name, stat.st_size, large_folder)
         else:
-            category = get_category(file_path, config=config)
-            action = f"{file_path.name} -> {category}/"
-        
-        category_dir = directory / category
-        destination = category_dir / file_path.name
-        
+            if uniform_category is not None and entry.name.endswith(uniform_ext):
+                category = uniform_category
+            else:
+                category = get_cat(splitext(entry.name)[1])
+            action = ("category", entry.name, category)
+
         result.actions.append(action)
-        
+
         if dry_run:
-            output(f"  [WOULD MOVE] {action}")
+            output(f"  [WOULD MOVE] {format_action(action)}")
         else:
-            try:
-                category_dir.mkdir(exist_ok=True)
-                destination = generate_unique_filename(destination)
-                shutil.move(str(file_path), str(destination))
-                output(f"  [MOVED] {action}")
-                result.success_count += 1
-            except Exception as e:
-                error_msg = f"{file_path.name}: {e}"
-                output(f"  [ERROR] {error_msg}")
-                result.errors.append(error_msg)
-                result.error_count += 1
+            moves.append((action, entry.name, entry.path, category))
+
+    if moves:
+        # Create each category directory once, then run the moves on a
+        # small pool: each is an independent rename that blocks in the
+        # kernel (GIL released), so a few threads saturate the
+        # filesystem's metadata-op throughput. Name collisions between
+        # threads are safe — claim_unique_filename reserves names with
+        # O_EXCL. Output and counters stay on this thread. A directory
+        # that cannot be created (e.g. a file named "Documents" in the
+        # way) fails every move targeting it as a per-file error rather
+        # than aborting the run.
+        dir_errors: Dict[str, OSError] = {}
+        for category in {m[3] for m in moves}:
+            if category not in created_dirs:
+                try:
+                    os.makedirs(os.path.join(dir_str, category), exist_ok=True)
+                    created_dirs.add(category)
+                except OSError as e:
+                    dir_errors[category] = e
+        with ThreadPoolExecutor(max_workers=_move_workers(config)) as pool:
+            futures = [
+                None if category in dir_errors
+                else pool.submit(_move_into, src, Path(os.path.join(dir_str, category, name)))
+                for _, name, src, category in moves
+            ]
+            for (action, name, _, category), future in zip(moves, futures):
+                try:
+                    if future is None:
+                        raise dir_errors[category]
+                    future.result()
+                    output(f"  [MOVED] {format_action(action)}")
+                    result.success_count += 1
+                except Exception as e:
+                    error_msg = f"{name}: {e}"
+                    output(f"  [ERROR] {error_msg}")
+                    result.errors.append(error_msg)
+                    result.error_count += 1
     
+    # Hidden files never reach the loop; count them as skipped. Files
+    # arriving between the counting and processing passes can push
+    # processed past the earlier total, so never report negative skips.
+    result.skip_count = max(0, total_files - processed)
+
     output("-" * 60)
     
     if dry_run:
@@ -212,21 +522,23 @@ def archive_old_files(
     if not directory.is_dir():
         raise ValueError(f"'{directory}' is not a valid directory")
     
-    # Get all files in the directory (top level only)
-    files = [f for f in directory.iterdir() if f.is_file()]
-    
     # Filter to only old, non-hidden files and cache age for later output.
+    # DirEntry.stat() reuses metadata from the listing where the OS
+    # provides it, and comparing mtime against one precomputed cutoff
+    # keeps the selection to a single float compare per file.
+    now_ts = time.time()
+    # "Older than N days" means strictly more than N whole days, same as
+    # the get_file_age_days() > N check this replaces.
+    cutoff = now_ts - (config.archive_age_days + 1) * 86400
     old_files = []
-    for f in files:
-        if config.is_hidden(f.name):
-            continue
+    for entry in _visible_files(directory, config):
         try:
-            age_days = get_file_age_days(f)
+            mtime = entry.stat().st_mtime
         except (PermissionError, OSError) as e:
-            output(f"  [WARNING] Could not inspect {f.name}: {e}")
+            output(f"  [WARNING] Could not inspect {entry.name}: {e}")
             continue
-        if age_days > config.archive_age_days:
-            old_files.append((f, age_days))
+        if mtime <= cutoff:
+            old_files.append((Path(entry.path), int((now_ts - mtime) // 86400)))
     
     if not old_files:
         output(f"No files older than {config.archive_age_days} days found.")
@@ -236,25 +548,25 @@ def archive_old_files(
     output(f"\n{prefix}Archiving {len(old_files)} files older than {config.archive_age_days} days\n")
     output("-" * 60)
     
-    archive_dir = directory / config.archive_folder
-    
+    archive_str = os.path.join(str(directory), config.archive_folder)
+    created_dirs: set = set()
+
     for file_path, age_days in old_files:
-        category = get_category(file_path, config=config)
-        
-        dest_dir = archive_dir / category
-        destination = dest_dir / file_path.name
-        
-        action = f"{file_path.name} ({age_days} days old) -> {config.archive_folder}/{category}/"
+        category = config.get_category(os.path.splitext(file_path.name)[1])
+
+        action = ("archive", file_path.name, age_days, config.archive_folder, category)
         result.actions.append(action)
-        
+
         if dry_run:
-            output(f"  [WOULD ARCHIVE] {action}")
+            output(f"  [WOULD ARCHIVE] {format_action(action)}")
         else:
             try:
-                dest_dir.mkdir(parents=True, exist_ok=True)
-                destination = generate_unique_filename(destination)
-                shutil.move(str(file_path), str(destination))
-                output(f"  [ARCHIVED] {action}")
+                # Create each archive category directory at most once per run
+                if category not in created_dirs:
+                    os.makedirs(os.path.join(archive_str, category), exist_ok=True)
+                    created_dirs.add(category)
+                _move_into(file_path, Path(os.path.join(archive_str, category, file_path.name)))
+                output(f"  [ARCHIVED] {format_action(action)}")
                 result.success_count += 1
             except Exception as e:
                 error_msg = f"{file_path.name}: {e}"
@@ -300,19 +612,29 @@ def cleanup_temp_files(
         return result
     
     # Find all files eligible for deletion and cache age for output.
+    now_ts = time.time()
+    # Strictly more than N whole days old, matching get_file_age_days() > N.
+    cutoff = now_ts - (config.auto_delete_age_days + 1) * 86400
     files_to_delete = []
-    for f in directory.iterdir():
-        if not f.is_file():
+    auto_delete_suffixes = config.auto_delete_suffixes
+    auto_delete_extensions = config.auto_delete_extensions
+    # Cleanup never filtered on name: hidden temp files are deleted too.
+    for entry in _visible_files(directory, config, skip_prefixes=()):
+        # Whole-name endswith is a cheap prefilter; the real suffix is
+        # then confirmed because a dotfile named exactly like an
+        # extension (e.g. ".ica") has no suffix and must be preserved,
+        # matching is_auto_deletable().
+        if not entry.name.lower().endswith(auto_delete_suffixes):
             continue
-        if f.suffix.lower() not in config.auto_delete_extensions:
+        if os.path.splitext(entry.name)[1].lower() not in auto_delete_extensions:
             continue
         try:
-            age_days = get_file_age_days(f)
+            mtime = entry.stat().st_mtime
         except (PermissionError, OSError) as e:
-            output(f"  [WARNING] Could not inspect {f.name}: {e}")
+            output(f"  [WARNING] Could not inspect {entry.name}: {e}")
             continue
-        if age_days > config.auto_delete_age_days:
-            files_to_delete.append((f, age_days))
+        if mtime <= cutoff:
+            files_to_delete.append((Path(entry.path), int((now_ts - mtime) // 86400)))
     
     if not files_to_delete:
         return result
@@ -321,23 +643,40 @@ def cleanup_temp_files(
     output(f"\n{prefix}Cleaning up {len(files_to_delete)} temporary files\n")
     output("-" * 60)
     
-    for file_path, age_days in files_to_delete:
-        action = f"{file_path.name} ({age_days} days old)"
-        result.actions.append(action)
-        
-        if dry_run:
-            output(f"  [WOULD DELETE] {action}")
-        else:
-            try:
-                file_path.unlink()
-                output(f"  [DELETED] {action}")
-                result.success_count += 1
-            except Exception as e:
-                error_msg = f"{file_path.name}: {e}"
-                output(f"  [ERROR] {error_msg}")
-                result.errors.append(error_msg)
-                result.error_count += 1
-    
+    # Unlink relative to an open directory fd where the platform allows,
+    # so the kernel resolves the directory path once for the whole batch
+    # instead of re-walking it for every delete.
+    dir_fd = None
+    if not dry_run and os.unlink in os.supports_dir_fd:
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            dir_fd = None
+
+    try:
+        for file_path, age_days in files_to_delete:
+            action = ("delete", file_path.name, age_days)
+            result.actions.append(action)
+
+            if dry_run:
+                output(f"  [WOULD DELETE] {format_action(action)}")
+            else:
+                try:
+                    if dir_fd is not None:
+                        os.unlink(file_path.name, dir_fd=dir_fd)
+                    else:
+                        file_path.unlink()
+                    output(f"  [DELETED] {format_action(action)}")
+                    result.success_count += 1
+                except Exception as e:
+                    error_msg = f"{file_path.name}: {e}"
+                    output(f"  [ERROR] {error_msg}")
+                    result.errors.append(error_msg)
+                    result.error_count += 1
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
     output("-" * 60)
     
     if dry_run:
@@ -353,53 +692,171 @@ def find_duplicates(
     recursive: bool = True,
     config: Config = DEFAULT_CONFIG,
     output: OutputCallback = print,
+    stat_cache: Optional[Dict[Path, os.stat_result]] = None,
 ) -> Dict[str, List[Path]]:
     """
     Find duplicate files in a directory by comparing file hashes.
-    
+
+    Files are grouped by size first, then by a head+tail sketch hash, so
+    only files that still collide get a full hash. On typical trees this
+    skips hashing for the vast majority of files.
+
     Args:
         directory: Path to scan for duplicates
         recursive: If True, scan subdirectories too
         config: Configuration to use
         output: Callback for output messages
-        
+        stat_cache: Optional dict that is filled with the stat result for
+            each scanned file, so callers can avoid re-statting
+
     Returns:
-        Dictionary mapping hash -> list of duplicate file paths
-        Only includes hashes with 2+ files (actual duplicates)
+        Dictionary mapping an opaque group id -> list of duplicate file
+        paths. Ids are derived from content hashes, size/sketch pairs
+        (byte-verified two-file groups), or suffixed hashes (split
+        collision groups) — treat them as identifiers only, not as
+        content hashes. Only groups with 2+ files are included.
     """
     hash_to_files: Dict[str, List[Path]] = defaultdict(list)
     size_to_files: Dict[int, List[Path]] = defaultdict(list)
+    if stat_cache is None:
+        stat_cache = {}
     scanned = 0
-    
-    files_iter = directory.rglob("*") if recursive else directory.iterdir()
-    for file_path in files_iter:
-        if not file_path.is_file():
-            continue
-        if should_skip_for_duplicates(file_path, directory, config):
-            continue
-        try:
-            stat = file_path.stat()
-        except (PermissionError, OSError) as e:
-            output(f"  [WARNING] Could not inspect {file_path.name}: {e}")
-            continue
-        
-        size_to_files[stat.st_size].append(file_path)
+
+    # Scanned files stream straight into the size buckets; the full
+    # listing is never materialized, so memory stays proportional to the
+    # bucket index rather than to one FileInfo per file.
+    def _record(info: FileInfo) -> None:
+        nonlocal scanned
+        stat_cache[info.path] = info.stat
+        size_to_files[info.st_size].append(info.path)
         scanned += 1
-    
+
+    if recursive:
+        # Parallel walk already prunes special/hidden dirs and empty
+        # files; unreadable entries surface as the same warnings the
+        # non-recursive branch emits.
+        _parallel_walk(
+            directory,
+            config,
+            _record,
+            on_error=lambda msg: output(f"  [WARNING] {msg}"),
+        )
+    else:
+        skip = ('.', config.special_folder_prefix)
+        for entry in _visible_files(directory, config, skip_prefixes=skip):
+            try:
+                info = FileInfo.from_direntry(entry)
+            except (PermissionError, OSError) as e:
+                output(f"  [WARNING] Could not inspect {entry.name}: {e}")
+                continue
+            if info.st_size > 0:
+                _record(info)
+
     output(f"Scanning {scanned} files for duplicates...")
-    
-    for same_size_files in size_to_files.values():
-        if len(same_size_files) < 2:
+
+    # Hashing runs as a pipeline stage overlapping the sketch pass: as
+    # soon as a sketch group yields candidates they are submitted to the
+    # hash pool, so full-file reads proceed while later size buckets are
+    # still being sketched. The GIL is released during reads and hash
+    # updates, so the threads genuinely overlap I/O. Grouping (and any
+    # moving by callers) cannot be pipelined the same way — picking the
+    # original in each set needs every member's hash first.
+    def _hash_one(file_path: Path):
+        try:
+            return file_path, compute_file_hash(file_path, config.hash_buffer_size)
+        except (PermissionError, OSError) as e:
+            return file_path, e
+
+    # With a persistent cache configured, reuse hashes for files whose
+    # size and mtime are unchanged since the last run; only misses are
+    # actually read and hashed.
+    cache = HashCache(config.hash_cache_path) if config.hash_cache_path else None
+    futures = []
+    pair_duplicates: Dict[str, List[Path]] = {}
+
+    def _submit(pool: ThreadPoolExecutor, file_path: Path) -> None:
+        if cache is not None:
+            cached = cache.get(file_path, stat_cache[file_path])
+            if cached is not None:
+                hash_to_files[cached].append(file_path)
+                return
+        _prefetch(file_path)
+        futures.append(pool.submit(_hash_one, file_path))
+
+    try:
+        with ThreadPoolExecutor(max_workers=_hash_workers(config)) as pool:
+            for file_size, same_size_files in size_to_files.items():
+                if len(same_size_files) < 2:
+                    continue
+
+                # Subdivide each size bucket by a head+tail sketch; only
+                # files matching on both size and sketch get a full hash.
+                sketch_to_files: Dict[str, List[Path]] = defaultdict(list)
+                for file_path in same_size_files:
+                    try:
+                        sketch = compute_file_sketch(file_path, size=file_size)
+                        sketch_to_files[sketch].append(file_path)
+                    except (PermissionError, OSError) as e:
+                        output(f"  [WARNING] Could not read {file_path.name}: {e}")
+
+                for sketch, sketch_group in sketch_to_files.items():
+                    if len(sketch_group) == 2:
+                        # For a pair, a streaming compare with early exit
+                        # settles the question while reading fewer bytes
+                        # than hashing both files whenever they differ.
+                        first, second = sketch_group
+                        try:
+                            if filecmp.cmp(first, second, shallow=False):
+                                pair_duplicates[f"{file_size}:{sketch}"] = sketch_group
+                        except OSError as e:
+                            output(
+                                f"  [WARNING] Could not compare "
+                                f"{first.name} and {second.name}: {e}"
+                            )
+                    elif len(sketch_group) > 2:
+                        for file_path in sketch_group:
+                            _submit(pool, file_path)
+
+            for future in futures:
+                file_path, outcome = future.result()
+                if isinstance(outcome, str):
+                    hash_to_files[outcome].append(file_path)
+                    if cache is not None:
+                        cache.put(file_path, stat_cache[file_path], outcome)
+                else:
+                    output(f"  [WARNING] Could not read {file_path.name}: {outcome}")
+    finally:
+        if cache is not None:
+            cache.close()
+
+    # Filter to actual duplicates and verify byte-wise: the hash is
+    # non-cryptographic, so collisions are split before reporting.
+    # Two-file clusters were already byte-verified above.
+    duplicates: Dict[str, List[Path]] = dict(pair_duplicates)
+    for file_hash, paths in hash_to_files.items():
+        if len(paths) < 2:
             continue
-        for file_path in same_size_files:
+        for i, group in enumerate(_split_by_content(paths)):
+            if len(group) > 1:
+                key = file_hash if i == 0 else f"{file_hash}:{i}"
+                duplicates[key] = group
+    return duplicates
+
+
+def _split_by_content(paths: List[Path]) -> List[List[Path]]:
+    """Split same-hash files into groups of byte-identical files."""
+    groups: List[List[Path]] = []
+    for path in paths:
+        for group in groups:
             try:
-                file_hash = compute_file_hash(file_path, config.hash_buffer_size)
-                hash_to_files[file_hash].append(file_path)
-            except (PermissionError, OSError) as e:
-                output(f"  [WARNING] Could not read {file_path.name}: {e}")
-    
-    # Filter to only include actual duplicates (2+ files with same hash)
-    return {h: paths for h, paths in hash_to_files.items() if len(paths) > 1}
+                if filecmp.cmp(path, group[0], shallow=False):
+                    group.append(path)
+                    break
+            except OSError:
+                continue
+        else:
+            groups.append([path])
+    return groups
 
 
 def handle_duplicates(
@@ -423,9 +880,12 @@ def handle_duplicates(
         OperationResult with statistics
     """
     result = OperationResult()
-    
-    duplicates = find_duplicates(directory, config=config, output=output)
-    
+
+    stat_cache: Dict[Path, os.stat_result] = {}
+    duplicates = find_duplicates(
+        directory, config=config, output=output, stat_cache=stat_cache
+    )
+
     if not duplicates:
         output("No duplicate files found.")
         return result
@@ -437,6 +897,7 @@ def handle_duplicates(
     output(f"\n{prefix}Found {total_sets} sets of duplicates ({total_extra} extra files)\n")
     output("-" * 60)
     
+    dir_str = str(directory)
     duplicates_dir = directory / config.duplicates_folder
     if not dry_run:
         duplicates_dir.mkdir(exist_ok=True)
@@ -444,6 +905,11 @@ def handle_duplicates(
     for file_hash, file_list in duplicates.items():
         file_stats = {}
         for file_path in file_list:
+            # The scan already statted every candidate; only re-stat on a miss.
+            stat = stat_cache.get(file_path)
+            if stat is not None:
+                file_stats[file_path] = stat
+                continue
             try:
                 file_stats[file_path] = file_path.stat()
             except (PermissionError, OSError) as e:
@@ -459,28 +925,26 @@ def handle_duplicates(
         original = file_list[0]
         duplicates_to_move = file_list[1:]
         
-        output(f"\n  Original: {original.relative_to(directory)}")
-        
+        output(f"\n  Original: {os.path.relpath(original, dir_str)}")
+
         for dup in duplicates_to_move:
             size = file_stats[dup].st_size
-            size_str = format_file_size(size)
             result.space_recoverable += size
-            
-            action = f"{dup.relative_to(directory)} ({size_str})"
+
+            relative_path = os.path.relpath(dup, dir_str)
+            action = ("duplicate", relative_path, size)
             result.actions.append(action)
-            
+
             if dry_run:
-                output(f"    [WOULD MOVE] {action}")
+                output(f"    [WOULD MOVE] {format_action(action)}")
             else:
                 try:
                     # Preserve relative path structure
-                    relative_path = dup.relative_to(directory)
                     dest = duplicates_dir / relative_path
                     dest.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    dest = generate_unique_filename(dest)
-                    shutil.move(str(dup), str(dest))
-                    output(f"    [MOVED] {action}")
+
+                    _move_into(dup, dest)
+                    output(f"    [MOVED] {format_action(action)}")
                     result.success_count += 1
                 except Exception as e:
                     error_msg = f"{dup.name}: {e}"
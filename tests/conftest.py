@@ -6,17 +6,66 @@ test files, and mock configurations.
 """
 
 import pytest
-from datetime import datetime, timedelta
+from collections import deque
 from pathlib import Path
 import os
+import shutil
+import tempfile
+import time
 
 from file_organizer.config import Config
 
 
+def _mkfile(path: Path, content: bytes) -> None:
+    """Create a file with one open/write/close, skipping Path.write_text's
+    encoder and io-stack setup; fixture creation dominates setup time for
+    tests that build many files."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content)
+    finally:
+        os.close(fd)
+
+
 @pytest.fixture
-def temp_dir(tmp_path: Path) -> Path:
-    """Create a temporary directory for testing."""
-    return tmp_path
+def temp_dir(tmp_path: Path):
+    """
+    Create a temporary directory for testing.
+
+    Set FILEORG_TMPFS=1 to place it on /dev/shm (Linux tmpfs) so the
+    suite's many tiny writes, utimes, and moves hit memory instead of
+    the block device; defaults to pytest's tmp_path otherwise.
+    """
+    if os.environ.get("FILEORG_TMPFS") == "1" and os.access("/dev/shm", os.W_OK):
+        path = Path(tempfile.mkdtemp(prefix="fileorg-", dir="/dev/shm"))
+        yield path
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        yield tmp_path
+
+
+@pytest.fixture
+def make_tree():
+    """
+    Build a directory layout from a {relative path: bytes} spec.
+
+    Parent directories are created once per unique parent and files go
+    through the raw-write helper, so tests collapse to a layout spec
+    plus assertions instead of repeated mkdir/write_text sequences.
+    """
+    def _make(root: Path, spec: dict) -> None:
+        for parent in {os.path.dirname(rel) for rel in spec}:
+            if parent:
+                os.makedirs(root / parent, exist_ok=True)
+        for rel, content in spec.items():
+            _mkfile(root / rel, content)
+    return _make
+
+
+@pytest.fixture(scope="session")
+def default_config() -> Config:
+    """A default Config shared across the session; treat as read-only."""
+    return Config()
 
 
 @pytest.fixture
@@ -47,33 +96,23 @@ def sample_files(temp_dir: Path) -> dict:
         "Other": [],
     }
     
-    # Create image files - each with unique content
-    for i, ext in enumerate([".jpg", ".png", ".gif"]):
-        f = temp_dir / f"image{ext}"
-        f.write_text(f"fake image content {i} {ext}")  # Unique per file
-        files["Images"].append(f)
-    
-    # Create document files - each with unique content
-    for i, ext in enumerate([".pdf", ".txt", ".docx"]):
-        f = temp_dir / f"document{ext}"
-        f.write_text(f"fake document content {i} {ext}")  # Unique per file
-        files["Documents"].append(f)
-    
-    # Create audio files - each with unique content
-    for i, ext in enumerate([".mp3", ".wav"]):
-        f = temp_dir / f"audio{ext}"
-        f.write_text(f"fake audio content {i} {ext}")  # Unique per file
-        files["Audio"].append(f)
-    
-    # Create code files - each with unique content
-    for i, ext in enumerate([".py", ".js"]):
-        f = temp_dir / f"code{ext}"
-        f.write_text(f"# fake code {i} {ext}")  # Unique per file
-        files["Code"].append(f)
-    
+    # (category, stem, extensions, content template) — content is unique
+    # per file so none of them register as duplicates.
+    specs = [
+        ("Images", "image", [".jpg", ".png", ".gif"], "fake image content"),
+        ("Documents", "document", [".pdf", ".txt", ".docx"], "fake document content"),
+        ("Audio", "audio", [".mp3", ".wav"], "fake audio content"),
+        ("Code", "code", [".py", ".js"], "# fake code"),
+    ]
+    for category, stem, exts, template in specs:
+        for i, ext in enumerate(exts):
+            f = temp_dir / f"{stem}{ext}"
+            _mkfile(f, f"{template} {i} {ext}".encode())
+            files[category].append(f)
+
     # Create unknown extension file
     f = temp_dir / "unknown.xyz"
-    f.write_text("unknown content unique")
+    _mkfile(f, b"unknown content unique")
     files["Other"].append(f)
     
     return files
@@ -84,15 +123,41 @@ def old_file(temp_dir: Path) -> Path:
     """Create a file that is 60 days old."""
     f = temp_dir / "old_file.txt"
     f.write_text("old content")
-    
+
     # Set modification time to 60 days ago
-    old_time = datetime.now() - timedelta(days=60)
-    old_timestamp = old_time.timestamp()
+    old_timestamp = time.time() - 60 * 86400
     os.utime(f, (old_timestamp, old_timestamp))
     
     return f
 
 
+@pytest.fixture(scope="session")
+def old_file_ro(tmp_path_factory) -> Path:
+    """
+    A 60-day-old file shared across the session.
+
+    For tests that only read age or extension; tests that move or
+    delete must use the function-scoped old_file instead.
+    """
+    f = tmp_path_factory.mktemp("ro") / "old_file.txt"
+    _mkfile(f, b"old content")
+    old_timestamp = time.time() - 60 * 86400
+    os.utime(f, (old_timestamp, old_timestamp))
+    yield f
+    assert f.exists(), "read-only fixture was mutated by a test"
+
+
+@pytest.fixture(scope="session")
+def ica_file_ro(tmp_path_factory) -> Path:
+    """A 3-day-old .ica file shared across the session; read-only."""
+    f = tmp_path_factory.mktemp("ro") / "session.ica"
+    _mkfile(f, b"[WFClient]\nVersion=2")
+    old_timestamp = time.time() - 3 * 86400
+    os.utime(f, (old_timestamp, old_timestamp))
+    yield f
+    assert f.exists(), "read-only fixture was mutated by a test"
+
+
 @pytest.fixture
 def recent_file(temp_dir: Path) -> Path:
     """Create a file that is only 30 minutes old."""
@@ -105,19 +170,20 @@ def recent_file(temp_dir: Path) -> Path:
 @pytest.fixture
 def duplicate_files(temp_dir: Path) -> list:
     """Create duplicate files with identical content."""
-    content = "This is duplicate content that will produce the same hash."
-    
+    content = b"This is duplicate content that will produce the same hash."
+
     files = []
     # Create files with staggered times: original is oldest (3h ago), copies are newer
     names_and_hours = [("original.txt", 3), ("copy1.txt", 2), ("copy2.txt", 1)]
-    
+
+    now = time.time()
     for name, hours_ago in names_and_hours:
         f = temp_dir / name
-        f.write_text(content)
-        
+        _mkfile(f, content)
+
         # Set modification time
-        old_time = datetime.now() - timedelta(hours=hours_ago)
-        os.utime(f, (old_time.timestamp(), old_time.timestamp()))
+        old_timestamp = now - hours_ago * 3600
+        os.utime(f, (old_timestamp, old_timestamp))
         files.append(f)
     
     return files
@@ -136,10 +202,10 @@ def ica_file(temp_dir: Path) -> Path:
     """Create an old .ica file for cleanup testing."""
     f = temp_dir / "session.ica"
     f.write_text("[WFClient]\nVersion=2")
-    
+
     # Set modification time to 3 days ago
-    old_time = datetime.now() - timedelta(days=3)
-    os.utime(f, (old_time.timestamp(), old_time.timestamp()))
+    old_timestamp = time.time() - 3 * 86400
+    os.utime(f, (old_timestamp, old_timestamp))
     
     return f
 
@@ -148,20 +214,22 @@ def ica_file(temp_dir: Path) -> Path:
 def large_file(temp_dir: Path, test_config: Config) -> Path:
     """Create a file larger than the test threshold."""
     f = temp_dir / "large_file.bin"
-    # Write more than 1 MB
-    f.write_bytes(b"x" * (test_config.large_file_threshold_bytes + 1000))
+    # Only the size matters to the tests, so truncate to a sparse file
+    # instead of allocating and writing 1 MB of real bytes.
+    with open(f, "wb") as fh:
+        fh.truncate(test_config.large_file_threshold_bytes + 1000)
     return f
 
 
 @pytest.fixture
-def capture_output() -> list:
-    """Create a list to capture output from operations."""
-    return []
+def capture_output() -> deque:
+    """Create a deque to capture output from operations."""
+    return deque()
 
 
 @pytest.fixture
-def output_callback(capture_output: list):
+def output_callback(capture_output: deque):
     """Create an output callback that captures messages."""
-    def callback(message: str) -> None:
-        capture_output.append(message)
-    return callback
+    # The bound append is the callback directly: no wrapper frame per
+    # message, and deque appends never reallocate.
+    return capture_output.append
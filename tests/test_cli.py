@@ -71,12 +71,24 @@ class TestCreateParser:
     
     def test_recents_flag(self):
         parser = create_parser()
-        
+
         args = parser.parse_args(["/tmp", "--recents"])
         assert args.recents is True
-        
+
         args = parser.parse_args(["/tmp", "-r"])
         assert args.recents is True
+
+    def test_jobs_flag(self):
+        parser = create_parser()
+
+        args = parser.parse_args(["/tmp", "--jobs", "4"])
+        assert args.jobs == 4
+
+        args = parser.parse_args(["/tmp", "-j", "4"])
+        assert args.jobs == 4
+
+        args = parser.parse_args(["/tmp"])
+        assert args.jobs == 0
     
     def test_multiple_flags(self):
         parser = create_parser()
@@ -140,13 +152,13 @@ class TestRun:
         We need to test the flow where a file is old enough but not organized.
         """
         import os
-        from datetime import datetime, timedelta
-        
+        import time
+
         # Create an old file
         old_file = temp_dir / "old_doc.pdf"
         old_file.write_text("old content")
-        old_time = datetime.now() - timedelta(days=60)
-        os.utime(old_file, (old_time.timestamp(), old_time.timestamp()))
+        old_timestamp = time.time() - 60 * 86400
+        os.utime(old_file, (old_timestamp, old_timestamp))
         
         parser = create_parser()
         # Use dry-run for organize so file stays in place, but archive runs
@@ -179,6 +191,25 @@ class TestRun:
         # Duplicates folder should exist
         assert (temp_dir / test_config.duplicates_folder).is_dir()
     
+    def test_jobs_sets_parallelism(self, temp_dir: Path, monkeypatch):
+        """Test that a positive --jobs value lands in Config.parallelism."""
+        from file_organizer import cli
+
+        captured = {}
+
+        def fake_organize(directory, **kwargs):
+            captured["config"] = kwargs["config"]
+
+        monkeypatch.setattr(cli, "organize_files", fake_organize)
+
+        parser = create_parser()
+        args = parser.parse_args([str(temp_dir), "--jobs", "6"])
+
+        result = run(args)
+
+        assert result == 0
+        assert captured["config"].parallelism == 6
+
     def test_with_recents_flag(self, temp_dir: Path, test_config: Config):
         # Create a new file
         new_file = temp_dir / "new.txt"
@@ -224,8 +255,10 @@ class TestEndToEnd:
     def test_full_workflow(self, temp_dir: Path, test_config: Config):
         """Test a complete workflow with multiple operations."""
         import os
-        from datetime import datetime, timedelta
-        
+        import time
+
+        now = time.time()
+
         # Create various test files
         # 1. New file (should go to recents)
         new_file = temp_dir / "new_doc.pdf"
@@ -234,15 +267,15 @@ class TestEndToEnd:
         # 2. Old file (should be archived)
         old_file = temp_dir / "old_doc.pdf"
         old_file.write_text("old content unique")
-        old_time = datetime.now() - timedelta(days=60)
-        os.utime(old_file, (old_time.timestamp(), old_time.timestamp()))
+        old_timestamp = now - 60 * 86400
+        os.utime(old_file, (old_timestamp, old_timestamp))
         
         # 3. Duplicate files
         dup_content = "duplicate content for testing"
         dup1 = temp_dir / "original_dup.txt"
         dup1.write_text(dup_content)
-        dup1_time = datetime.now() - timedelta(hours=5)
-        os.utime(dup1, (dup1_time.timestamp(), dup1_time.timestamp()))
+        dup1_timestamp = now - 5 * 3600
+        os.utime(dup1, (dup1_timestamp, dup1_timestamp))
         
         dup2 = temp_dir / "copy_dup.txt"
         dup2.write_text(dup_content)
@@ -250,8 +283,8 @@ class TestEndToEnd:
         # 4. Old .ica file (should be deleted)
         ica = temp_dir / "session.ica"
         ica.write_text("ica content")
-        ica_time = datetime.now() - timedelta(days=5)
-        os.utime(ica, (ica_time.timestamp(), ica_time.timestamp()))
+        ica_timestamp = now - 5 * 86400
+        os.utime(ica, (ica_timestamp, ica_timestamp))
         
         # Run with all flags
         result = main([
@@ -0,0 +1,124 @@
+"""
+Unit tests for file_organizer.hash_cache module.
+
+Tests the persistent hash cache used by duplicate detection.
+"""
+
+import os
+from pathlib import Path
+
+from file_organizer import operations
+from file_organizer.config import Config
+from file_organizer.hash_cache import HashCache
+from file_organizer.operations import find_duplicates
+
+
+class TestHashCache:
+    """Tests for the HashCache class."""
+
+    def test_roundtrip(self, temp_dir: Path):
+        f = temp_dir / "file.txt"
+        f.write_text("content")
+        st = f.stat()
+
+        with HashCache(temp_dir / "cache.db") as cache:
+            assert cache.get(f, st) is None
+            cache.put(f, st, "abc123")
+            assert cache.get(f, st) == "abc123"
+
+    def test_persists_across_instances(self, temp_dir: Path):
+        f = temp_dir / "file.txt"
+        f.write_text("content")
+        st = f.stat()
+        db = temp_dir / "cache.db"
+
+        with HashCache(db) as cache:
+            cache.put(f, st, "abc123")
+
+        with HashCache(db) as cache:
+            assert cache.get(f, st) == "abc123"
+
+    def test_stale_entry_not_returned(self, temp_dir: Path):
+        f = temp_dir / "file.txt"
+        f.write_text("content")
+        st = f.stat()
+        db = temp_dir / "cache.db"
+
+        with HashCache(db) as cache:
+            cache.put(f, st, "abc123")
+
+        # Modify the file; the old entry must not be returned
+        f.write_text("different content")
+        with HashCache(db) as cache:
+            assert cache.get(f, f.stat()) is None
+
+    def test_creates_parent_directory(self, temp_dir: Path):
+        db = temp_dir / "nested" / "dir" / "cache.db"
+
+        with HashCache(db):
+            pass
+
+        assert db.exists()
+
+    def test_corrupt_cache_file_is_replaced(self, temp_dir: Path):
+        f = temp_dir / "file.txt"
+        f.write_text("content")
+        st = f.stat()
+        db = temp_dir / "cache.db"
+        db.write_bytes(b"this is not a sqlite database")
+
+        # Opening must not raise, and the cache must work afterwards
+        with HashCache(db) as cache:
+            cache.put(f, st, "abc123")
+            assert cache.get(f, st) == "abc123"
+
+
+class TestFindDuplicatesWithCache:
+    """Tests for find_duplicates using a configured hash cache."""
+
+    def test_finds_duplicates_with_cache(
+        self, temp_dir: Path, duplicate_files: list, output_callback
+    ):
+        config = Config(hash_cache_path=temp_dir / ".cache.db")
+
+        duplicates = find_duplicates(temp_dir, config=config, output=output_callback)
+
+        assert len(duplicates) == 1
+        files = list(duplicates.values())[0]
+        assert len(files) == 3
+
+    def test_second_run_uses_cached_hashes(
+        self, temp_dir: Path, duplicate_files: list, output_callback, monkeypatch
+    ):
+        config = Config(hash_cache_path=temp_dir / ".cache.db")
+
+        # Count full-hash computations so cache hits are observable
+        calls = []
+        real_hash = operations.compute_file_hash
+
+        def counting_hash(file_path, *args, **kwargs):
+            calls.append(file_path)
+            return real_hash(file_path, *args, **kwargs)
+
+        monkeypatch.setattr(operations, "compute_file_hash", counting_hash)
+
+        first = find_duplicates(temp_dir, config=config, output=output_callback)
+        first_calls = len(calls)
+        assert first_calls == len(duplicate_files)
+
+        second = find_duplicates(temp_dir, config=config, output=output_callback)
+
+        assert first == second
+        # Every hash came from the cache: no new computations
+        assert len(calls) == first_calls
+
+    def test_corrupt_cache_does_not_abort_run(
+        self, temp_dir: Path, duplicate_files: list, output_callback
+    ):
+        cache_path = temp_dir / ".cache.db"
+        cache_path.write_bytes(b"this is not a sqlite database")
+        config = Config(hash_cache_path=cache_path)
+
+        duplicates = find_duplicates(temp_dir, config=config, output=output_callback)
+
+        assert len(duplicates) == 1
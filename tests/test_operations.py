@@ -5,8 +5,9 @@ Tests file operations with actual file system interactions.
 """
 
 import os
+from collections import deque
 import pytest
-from datetime import datetime, timedelta
+import time
 from pathlib import Path
 
 from file_organizer.config import Config
@@ -24,7 +25,7 @@ from file_organizer.operations import (
 class TestOrganizeFiles:
     """Tests for organize_files function."""
     
-    def test_organizes_files_by_category(self, temp_dir: Path, sample_files: dict, capture_output: list, output_callback):
+    def test_organizes_files_by_category(self, temp_dir: Path, sample_files: dict, capture_output: deque, output_callback):
         """Test that files are moved to correct category folders."""
         result = organize_files(temp_dir, output=output_callback)
         
@@ -42,15 +43,15 @@ class TestOrganizeFiles:
         assert (temp_dir / "Images" / "image.jpg").exists()
         assert (temp_dir / "Documents" / "document.pdf").exists()
     
-    def test_dry_run_does_not_move_files(self, temp_dir: Path, sample_files: dict, capture_output: list, output_callback):
+    def test_dry_run_does_not_move_files(self, temp_dir: Path, sample_files: dict, capture_output: deque, output_callback):
         """Test that dry run only previews changes."""
-        original_files = list(temp_dir.iterdir())
-        
+        original_count = sum(1 for e in os.scandir(temp_dir) if e.is_file(follow_symlinks=False))
+
         result = organize_files(temp_dir, dry_run=True, output=output_callback)
-        
+
         # Files should not have moved
-        current_files = [f for f in temp_dir.iterdir() if f.is_file()]
-        assert len(current_files) == len([f for f in original_files if f.is_file()])
+        current_count = sum(1 for e in os.scandir(temp_dir) if e.is_file(follow_symlinks=False))
+        assert current_count == original_count
         
         # But actions should be recorded
         assert len(result.actions) > 0
@@ -58,7 +59,7 @@ class TestOrganizeFiles:
         # Output should indicate dry run
         assert any("[DRY RUN]" in msg for msg in capture_output)
     
-    def test_skips_hidden_files(self, temp_dir: Path, hidden_file: Path, capture_output: list, output_callback):
+    def test_skips_hidden_files(self, temp_dir: Path, hidden_file: Path, capture_output: deque, output_callback):
         """Test that hidden files are skipped."""
         # Create a regular file too
         regular = temp_dir / "regular.txt"
@@ -70,7 +71,17 @@ class TestOrganizeFiles:
         # Hidden file should still be in root
         assert hidden_file.exists()
     
-    def test_recents_mode_keeps_new_files_separate(self, temp_dir: Path, test_config: Config, capture_output: list, output_callback):
+    def test_organizes_underscore_prefixed_files(self, temp_dir: Path, capture_output: deque, output_callback):
+        """Test that top-level files starting with _ are still organized."""
+        f = temp_dir / "_notes.txt"
+        f.write_text("content")
+
+        result = organize_files(temp_dir, output=output_callback)
+
+        assert result.success_count == 1
+        assert (temp_dir / "Documents" / "_notes.txt").exists()
+
+    def test_recents_mode_keeps_new_files_separate(self, temp_dir: Path, test_config: Config, capture_output: deque, output_callback):
         """Test that recent files go to _Recents folder."""
         # Create a new file
         new_file = temp_dir / "new.txt"
@@ -86,25 +97,22 @@ class TestOrganizeFiles:
         assert result.success_count == 1
         assert (temp_dir / test_config.recents_folder / "new.txt").exists()
     
-    def test_large_files_go_to_large_folder(self, temp_dir: Path, large_file: Path, test_config: Config, capture_output: list, output_callback):
+    def test_large_files_go_to_large_folder(self, temp_dir: Path, large_file: Path, test_config: Config, capture_output: deque, output_callback):
         """Test that large files go to _LargeFiles folder."""
         result = organize_files(temp_dir, config=test_config, output=output_callback)
         
         assert result.success_count >= 1
         assert (temp_dir / test_config.large_files_folder / "large_file.bin").exists()
     
-    def test_handles_duplicate_filenames(self, temp_dir: Path, capture_output: list, output_callback):
+    def test_handles_duplicate_filenames(self, temp_dir: Path, make_tree, capture_output: deque, output_callback):
         """Test that duplicate filenames get timestamps."""
-        # Create file and its destination
+        # A file in the root colliding with one already organized
+        make_tree(temp_dir, {
+            "Documents/file.txt": b"existing",
+            "file.txt": b"new content",
+        })
         docs_dir = temp_dir / "Documents"
-        docs_dir.mkdir()
-        
-        existing = docs_dir / "file.txt"
-        existing.write_text("existing")
-        
-        new_file = temp_dir / "file.txt"
-        new_file.write_text("new content")
-        
+
         result = organize_files(temp_dir, output=output_callback)
         
         # Should have moved successfully with timestamp
@@ -112,15 +120,14 @@ class TestOrganizeFiles:
         assert result.error_count == 0
         
         # Both files should exist in Documents
-        docs_files = list(docs_dir.iterdir())
-        assert len(docs_files) == 2
+        assert sum(1 for _ in os.scandir(docs_dir)) == 2
     
     def test_invalid_directory_raises_error(self, temp_dir: Path):
         """Test that invalid directory raises ValueError."""
         with pytest.raises(ValueError, match="not a valid directory"):
             organize_files(temp_dir / "nonexistent")
     
-    def test_empty_directory(self, temp_dir: Path, capture_output: list, output_callback):
+    def test_empty_directory(self, temp_dir: Path, capture_output: deque, output_callback):
         """Test handling of empty directory."""
         result = organize_files(temp_dir, output=output_callback)
         
@@ -131,7 +138,7 @@ class TestOrganizeFiles:
 class TestArchiveOldFiles:
     """Tests for archive_old_files function."""
     
-    def test_archives_old_files(self, temp_dir: Path, old_file: Path, test_config: Config, capture_output: list, output_callback):
+    def test_archives_old_files(self, temp_dir: Path, old_file: Path, test_config: Config, capture_output: deque, output_callback):
         """Test that old files are moved to archive."""
         result = archive_old_files(temp_dir, config=test_config, output=output_callback)
         
@@ -142,29 +149,28 @@ class TestArchiveOldFiles:
         assert archive_path.exists()
         assert not old_file.exists()
     
-    def test_does_not_archive_recent_files(self, temp_dir: Path, recent_file: Path, test_config: Config, capture_output: list, output_callback):
+    def test_does_not_archive_recent_files(self, temp_dir: Path, recent_file: Path, test_config: Config, capture_output: deque, output_callback):
         """Test that recent files are not archived."""
         result = archive_old_files(temp_dir, config=test_config, output=output_callback)
         
         assert result.success_count == 0
         assert recent_file.exists()
     
-    def test_dry_run_does_not_move(self, temp_dir: Path, old_file: Path, test_config: Config, capture_output: list, output_callback):
+    def test_dry_run_does_not_move(self, temp_dir: Path, old_file: Path, test_config: Config, capture_output: deque, output_callback):
         """Test that dry run only previews."""
         result = archive_old_files(temp_dir, dry_run=True, config=test_config, output=output_callback)
         
         assert len(result.actions) == 1
         assert old_file.exists()  # File should still be in original location
     
-    def test_preserves_category_structure(self, temp_dir: Path, test_config: Config, capture_output: list, output_callback):
+    def test_preserves_category_structure(self, temp_dir: Path, make_tree, test_config: Config, capture_output: deque, output_callback):
         """Test that archive preserves category folders."""
         # Create old files of different types
-        for ext, category in [(".pdf", "Documents"), (".jpg", "Images")]:
-            f = temp_dir / f"old{ext}"
-            f.write_text("content")
-            old_time = datetime.now() - timedelta(days=60)
-            os.utime(f, (old_time.timestamp(), old_time.timestamp()))
-        
+        make_tree(temp_dir, {"old.pdf": b"pdf content", "old.jpg": b"jpg content"})
+        old_timestamp = time.time() - 60 * 86400
+        for name in ("old.pdf", "old.jpg"):
+            os.utime(temp_dir / name, (old_timestamp, old_timestamp))
+
         result = archive_old_files(temp_dir, config=test_config, output=output_callback)
         
         assert result.success_count == 2
@@ -175,14 +181,26 @@ class TestArchiveOldFiles:
 class TestCleanupTempFiles:
     """Tests for cleanup_temp_files function."""
     
-    def test_deletes_old_ica_files(self, temp_dir: Path, ica_file: Path, capture_output: list, output_callback):
+    def test_deletes_old_ica_files(self, temp_dir: Path, ica_file: Path, capture_output: deque, output_callback):
         """Test that old .ica files are deleted."""
         result = cleanup_temp_files(temp_dir, output=output_callback)
         
         assert result.success_count == 1
         assert not ica_file.exists()
     
-    def test_does_not_delete_new_ica_files(self, temp_dir: Path, capture_output: list, output_callback):
+    def test_deletes_hidden_ica_files(self, temp_dir: Path, capture_output: deque, output_callback):
+        """Test that cleanup does not exempt hidden files."""
+        hidden_ica = temp_dir / ".session.ica"
+        hidden_ica.write_text("content")
+        old_timestamp = time.time() - 3 * 86400
+        os.utime(hidden_ica, (old_timestamp, old_timestamp))
+
+        result = cleanup_temp_files(temp_dir, output=output_callback)
+
+        assert result.success_count == 1
+        assert not hidden_ica.exists()
+
+    def test_does_not_delete_new_ica_files(self, temp_dir: Path, capture_output: deque, output_callback):
         """Test that new .ica files are not deleted."""
         new_ica = temp_dir / "new.ica"
         new_ica.write_text("content")
@@ -192,14 +210,26 @@ class TestCleanupTempFiles:
         assert result.success_count == 0
         assert new_ica.exists()
     
-    def test_does_not_delete_other_extensions(self, temp_dir: Path, old_file: Path, capture_output: list, output_callback):
+    def test_preserves_dotfile_named_like_extension(self, temp_dir: Path, capture_output: deque, output_callback):
+        """Test that a dotfile named exactly like an extension is kept."""
+        dotfile = temp_dir / ".ica"
+        dotfile.write_text("content")
+        old_timestamp = time.time() - 3 * 86400
+        os.utime(dotfile, (old_timestamp, old_timestamp))
+
+        result = cleanup_temp_files(temp_dir, output=output_callback)
+
+        assert result.success_count == 0
+        assert dotfile.exists()
+
+    def test_does_not_delete_other_extensions(self, temp_dir: Path, old_file: Path, capture_output: deque, output_callback):
         """Test that other file types are not deleted."""
         result = cleanup_temp_files(temp_dir, output=output_callback)
         
         assert result.success_count == 0
         assert old_file.exists()
     
-    def test_dry_run_does_not_delete(self, temp_dir: Path, ica_file: Path, capture_output: list, output_callback):
+    def test_dry_run_does_not_delete(self, temp_dir: Path, ica_file: Path, capture_output: deque, output_callback):
         """Test that dry run only previews deletion."""
         result = cleanup_temp_files(temp_dir, dry_run=True, output=output_callback)
         
@@ -210,7 +240,7 @@ class TestCleanupTempFiles:
 class TestFindDuplicates:
     """Tests for find_duplicates function."""
     
-    def test_finds_duplicate_files(self, temp_dir: Path, duplicate_files: list, capture_output: list, output_callback):
+    def test_finds_duplicate_files(self, temp_dir: Path, duplicate_files: list, capture_output: deque, output_callback):
         """Test that duplicate files are detected."""
         duplicates = find_duplicates(temp_dir, output=output_callback)
         
@@ -220,32 +250,27 @@ class TestFindDuplicates:
         dup_list = list(duplicates.values())[0]
         assert len(dup_list) == 3
     
-    def test_no_duplicates_when_unique(self, temp_dir: Path, sample_files: dict, capture_output: list, output_callback):
+    def test_no_duplicates_when_unique(self, temp_dir: Path, sample_files: dict, capture_output: deque, output_callback):
         """Test that unique files are not reported as duplicates."""
         duplicates = find_duplicates(temp_dir, output=output_callback)
         
         # sample_files creates files with unique content
         assert len(duplicates) == 0
     
-    def test_skips_special_folders(self, temp_dir: Path, capture_output: list, output_callback):
+    def test_skips_special_folders(self, temp_dir: Path, make_tree, capture_output: deque, output_callback):
         """Test that files in special folders are skipped."""
         # Create duplicate in special folder
-        content = "duplicate content"
-        
-        regular = temp_dir / "file.txt"
-        regular.write_text(content)
-        
-        special_dir = temp_dir / "_Archive"
-        special_dir.mkdir()
-        special = special_dir / "file.txt"
-        special.write_text(content)
-        
+        make_tree(temp_dir, {
+            "file.txt": b"duplicate content",
+            "_Archive/file.txt": b"duplicate content",
+        })
+
         duplicates = find_duplicates(temp_dir, output=output_callback)
         
         # Should not find duplicates (special folder is skipped)
         assert len(duplicates) == 0
     
-    def test_recursive_scanning(self, temp_dir: Path, capture_output: list, output_callback):
+    def test_recursive_scanning(self, temp_dir: Path, capture_output: deque, output_callback):
         """Test that subdirectories are scanned."""
         content = "duplicate content"
         
@@ -267,7 +292,7 @@ class TestFindDuplicates:
 class TestHandleDuplicates:
     """Tests for handle_duplicates function."""
     
-    def test_moves_duplicates_to_folder(self, temp_dir: Path, duplicate_files: list, test_config: Config, capture_output: list, output_callback):
+    def test_moves_duplicates_to_folder(self, temp_dir: Path, duplicate_files: list, test_config: Config, capture_output: deque, output_callback):
         """Test that duplicates are moved to _Duplicates folder."""
         result = handle_duplicates(temp_dir, config=test_config, output=output_callback)
         
@@ -281,9 +306,9 @@ class TestHandleDuplicates:
         # Duplicates folder should exist with copies
         dup_dir = temp_dir / test_config.duplicates_folder
         assert dup_dir.is_dir()
-        assert len(list(dup_dir.iterdir())) == 2
+        assert sum(1 for _ in os.scandir(dup_dir)) == 2
     
-    def test_keeps_oldest_as_original(self, temp_dir: Path, duplicate_files: list, capture_output: list, output_callback):
+    def test_keeps_oldest_as_original(self, temp_dir: Path, duplicate_files: list, capture_output: deque, output_callback):
         """Test that the oldest file is kept as original."""
         # The duplicate_files fixture creates files with staggered times
         # First file is oldest
@@ -294,7 +319,7 @@ class TestHandleDuplicates:
         # Oldest should still exist in original location
         assert oldest.exists()
     
-    def test_dry_run_does_not_move(self, temp_dir: Path, duplicate_files: list, capture_output: list, output_callback):
+    def test_dry_run_does_not_move(self, temp_dir: Path, duplicate_files: list, capture_output: deque, output_callback):
         """Test that dry run only previews."""
         result = handle_duplicates(temp_dir, dry_run=True, output=output_callback)
         
@@ -304,13 +329,13 @@ class TestHandleDuplicates:
         for f in duplicate_files:
             assert f.exists()
     
-    def test_calculates_space_recoverable(self, temp_dir: Path, duplicate_files: list, capture_output: list, output_callback):
+    def test_calculates_space_recoverable(self, temp_dir: Path, duplicate_files: list, capture_output: deque, output_callback):
         """Test that space recoverable is calculated."""
         result = handle_duplicates(temp_dir, output=output_callback)
         
         assert result.space_recoverable > 0
     
-    def test_no_action_when_no_duplicates(self, temp_dir: Path, sample_files: dict, capture_output: list, output_callback):
+    def test_no_action_when_no_duplicates(self, temp_dir: Path, sample_files: dict, capture_output: deque, output_callback):
         """Test behavior when no duplicates exist."""
         result = handle_duplicates(temp_dir, output=output_callback)
         
@@ -321,7 +346,7 @@ class TestHandleDuplicates:
 class TestCleanupEmptyFolders:
     """Tests for cleanup_empty_folders function."""
     
-    def test_removes_empty_category_folder(self, temp_dir: Path, capture_output: list, output_callback):
+    def test_removes_empty_category_folder(self, temp_dir: Path, capture_output: deque, output_callback):
         """Test that empty category folders are removed."""
         empty_images = temp_dir / "Images"
         empty_images.mkdir()
@@ -331,7 +356,7 @@ class TestCleanupEmptyFolders:
         assert removed == 1
         assert not empty_images.exists()
     
-    def test_keeps_non_empty_folders(self, temp_dir: Path, capture_output: list, output_callback):
+    def test_keeps_non_empty_folders(self, temp_dir: Path, capture_output: deque, output_callback):
         """Test that folders with files are kept."""
         images = temp_dir / "Images"
         images.mkdir()
@@ -342,7 +367,7 @@ class TestCleanupEmptyFolders:
         assert removed == 0
         assert images.exists()
     
-    def test_ignores_user_folders(self, temp_dir: Path, capture_output: list, output_callback):
+    def test_ignores_user_folders(self, temp_dir: Path, capture_output: deque, output_callback):
         """Test that non-category folders are not removed."""
         user_folder = temp_dir / "MyStuff"
         user_folder.mkdir()
@@ -352,7 +377,7 @@ class TestCleanupEmptyFolders:
         assert removed == 0
         assert user_folder.exists()
     
-    def test_removes_empty_special_folders(self, temp_dir: Path, test_config: Config, capture_output: list, output_callback):
+    def test_removes_empty_special_folders(self, temp_dir: Path, test_config: Config, capture_output: deque, output_callback):
         """Test that empty special folders are removed."""
         archive = temp_dir / test_config.archive_folder
         archive.mkdir()
@@ -362,7 +387,7 @@ class TestCleanupEmptyFolders:
         assert removed == 1
         assert not archive.exists()
     
-    def test_dry_run_does_not_remove(self, temp_dir: Path, capture_output: list, output_callback):
+    def test_dry_run_does_not_remove(self, temp_dir: Path, capture_output: deque, output_callback):
         """Test that dry run only previews removal."""
         empty_images = temp_dir / "Images"
         empty_images.mkdir()
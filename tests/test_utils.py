@@ -26,6 +26,16 @@ from file_organizer.utils import (
     should_skip_for_duplicates,
 )
 
+# Every special folder the default config can create; the skip tests
+# are parametrized over these so a new folder is covered automatically.
+_defaults = Config()
+SPECIAL_FOLDERS = [
+    _defaults.archive_folder,
+    _defaults.duplicates_folder,
+    _defaults.large_files_folder,
+    _defaults.recents_folder,
+]
+
 
 class TestFormatFileSize:
     """Tests for format_file_size function."""
@@ -52,47 +62,36 @@ class TestFormatFileSize:
         assert format_file_size(1024 ** 4) == "1.00 TB"
 
 
+# Table of (filename, expected category) cases, including mixed-case
+# extensions and unknown extensions falling through to Other.
+CATEGORY_CASES = [
+    ("photo.jpg", "Images"),
+    ("photo.jpeg", "Images"),
+    ("image.PNG", "Images"),
+    ("icon.gif", "Images"),
+    ("doc.pdf", "Documents"),
+    ("doc.docx", "Documents"),
+    ("data.csv", "Documents"),
+    ("song.mp3", "Audio"),
+    ("sound.wav", "Audio"),
+    ("movie.mp4", "Video"),
+    ("clip.mov", "Video"),
+    ("script.py", "Code"),
+    ("app.js", "Code"),
+    ("file.xyz", "Other"),
+    ("file.unknown", "Other"),
+    ("photo.JPG", "Images"),
+    ("photo.Jpg", "Images"),
+    ("doc.PDF", "Documents"),
+]
+
+
 class TestGetCategory:
     """Tests for get_category function."""
-    
-    def test_image_extensions(self):
-        config = Config()
-        assert get_category(Path("photo.jpg"), config) == "Images"
-        assert get_category(Path("photo.jpeg"), config) == "Images"
-        assert get_category(Path("image.PNG"), config) == "Images"
-        assert get_category(Path("icon.gif"), config) == "Images"
-    
-    def test_document_extensions(self):
-        config = Config()
-        assert get_category(Path("doc.pdf"), config) == "Documents"
-        assert get_category(Path("doc.docx"), config) == "Documents"
-        assert get_category(Path("data.csv"), config) == "Documents"
-    
-    def test_audio_extensions(self):
-        config = Config()
-        assert get_category(Path("song.mp3"), config) == "Audio"
-        assert get_category(Path("sound.wav"), config) == "Audio"
-    
-    def test_video_extensions(self):
-        config = Config()
-        assert get_category(Path("movie.mp4"), config) == "Video"
-        assert get_category(Path("clip.mov"), config) == "Video"
-    
-    def test_code_extensions(self):
-        config = Config()
-        assert get_category(Path("script.py"), config) == "Code"
-        assert get_category(Path("app.js"), config) == "Code"
-    
-    def test_unknown_extension(self):
-        config = Config()
-        assert get_category(Path("file.xyz"), config) == "Other"
-        assert get_category(Path("file.unknown"), config) == "Other"
-    
-    def test_case_insensitive(self):
-        config = Config()
-        assert get_category(Path("photo.JPG"), config) == "Images"
-        assert get_category(Path("photo.Jpg"), config) == "Images"
-        assert get_category(Path("doc.PDF"), config) == "Documents"
+
+    @pytest.mark.parametrize("name,expected", CATEGORY_CASES)
+    def test_get_category(self, name: str, expected: str, default_config: Config):
+        assert get_category(Path(name), default_config) == expected
 
 
 class TestGetFileAgeDays:
@@ -104,9 +103,9 @@ class TestGetFileAgeDays:
         
         assert get_file_age_days(f) == 0
     
-    def test_old_file(self, old_file: Path):
-        # old_file fixture creates a file 60 days old
-        assert get_file_age_days(old_file) == 60
+    def test_old_file(self, old_file_ro: Path):
+        # old_file_ro fixture creates a file 60 days old
+        assert get_file_age_days(old_file_ro) == 60
     
     def test_with_custom_now(self, temp_dir: Path):
         f = temp_dir / "test.txt"
@@ -145,8 +144,8 @@ class TestIsOldFile:
         
         assert is_old_file(f) is False
     
-    def test_old_file_is_old(self, old_file: Path):
-        assert is_old_file(old_file) is True
+    def test_old_file_is_old(self, old_file_ro: Path):
+        assert is_old_file(old_file_ro) is True
     
     def test_custom_threshold(self, temp_dir: Path):
         f = temp_dir / "test.txt"
@@ -168,8 +167,8 @@ class TestIsRecentFile:
     def test_new_file_is_recent(self, recent_file: Path):
         assert is_recent_file(recent_file) is True
     
-    def test_old_file_not_recent(self, old_file: Path):
-        assert is_recent_file(old_file) is False
+    def test_old_file_not_recent(self, old_file_ro: Path):
+        assert is_recent_file(old_file_ro) is False
     
     def test_custom_threshold(self, temp_dir: Path, test_config: Config):
         f = temp_dir / "test.txt"
@@ -202,8 +201,8 @@ class TestIsLargeFile:
 class TestIsAutoDeletable:
     """Tests for is_auto_deletable function."""
     
-    def test_old_ica_is_deletable(self, ica_file: Path):
-        assert is_auto_deletable(ica_file) is True
+    def test_old_ica_is_deletable(self, ica_file_ro: Path):
+        assert is_auto_deletable(ica_file_ro) is True
     
     def test_new_ica_not_deletable(self, temp_dir: Path):
         f = temp_dir / "new.ica"
@@ -211,9 +210,9 @@ class TestIsAutoDeletable:
         # File is new (just created), so not deletable
         assert is_auto_deletable(f) is False
     
-    def test_other_extension_not_deletable(self, old_file: Path):
-        # old_file is a .txt file, not in auto_delete_extensions
-        assert is_auto_deletable(old_file) is False
+    def test_other_extension_not_deletable(self, old_file_ro: Path):
+        # old_file_ro is a .txt file, not in auto_delete_extensions
+        assert is_auto_deletable(old_file_ro) is False
 
 
 class TestComputeFileHash:
@@ -243,9 +242,9 @@ class TestComputeFileHash:
         f.write_text("content")
         
         hash_value = compute_file_hash(f)
-        
-        # MD5 produces 32 hex characters
-        assert len(hash_value) == 32
+
+        # 16 hex chars for xxh3, 32 for the MD5 fallback
+        assert len(hash_value) in (16, 32)
         assert all(c in "0123456789abcdef" for c in hash_value)
 
 
@@ -283,12 +282,13 @@ class TestShouldSkipFile:
         
         assert should_skip_file(f) is False
     
-    def test_file_in_special_folder_skipped(self, temp_dir: Path):
-        special_dir = temp_dir / "_Archive"
+    @pytest.mark.parametrize("folder", SPECIAL_FOLDERS)
+    def test_file_in_special_folder_skipped(self, temp_dir: Path, folder: str):
+        special_dir = temp_dir / folder
         special_dir.mkdir()
         f = special_dir / "file.txt"
         f.write_text("content")
-        
+
         assert should_skip_file(f) is True
 
 
@@ -304,12 +304,13 @@ class TestShouldSkipForDuplicates:
     def test_hidden_file_skipped(self, temp_dir: Path, hidden_file: Path):
         assert should_skip_for_duplicates(hidden_file, temp_dir) is True
     
-    def test_file_in_special_folder_skipped(self, temp_dir: Path):
-        special_dir = temp_dir / "_Duplicates"
+    @pytest.mark.parametrize("folder", SPECIAL_FOLDERS)
+    def test_file_in_special_folder_skipped(self, temp_dir: Path, folder: str):
+        special_dir = temp_dir / folder
         special_dir.mkdir()
         f = special_dir / "file.txt"
         f.write_text("content")
-        
+
         assert should_skip_for_duplicates(f, temp_dir) is True
     
     def test_regular_file_not_skipped(self, temp_dir: Path):